@@ -1,6 +1,6 @@
 """Performing first MD Run.
 
-We start from SDF file, read ligand, standardize and hydrogen it;
+We start from SDF file, stream its ligands one at a time, standardize and hydrogen them;
 We load protein;
 We parametrize ligand and load the protein force field parameters;
 We add solvent of a chosen water model and counter ions;
@@ -13,16 +13,42 @@ from __future__ import annotations
 import argparse
 import logging
 import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import BioSimSpace as BSS
 
+from gbsa_pipeline.cache import DEFAULT_CACHE_DIR, load_or_parametrize
 from gbsa_pipeline.equilibration import run_heating
-from gbsa_pipeline.ligand_preparation import ligand_converter
+from gbsa_pipeline.ligand_preparation import stream_ligands, write_ligand_sdf
 from gbsa_pipeline.minimization import run_minimization
-from gbsa_pipeline.parametrization import load_and_parameterise
+from gbsa_pipeline.parametrization import ParametrizationConfig, ParametrizationInput, parametrize
+from gbsa_pipeline.parametrization_enum import ChargeMethod, ProteinFF
 from gbsa_pipeline.solvation_box import SolvationParams, WaterModel, run_solvation
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from concurrent.futures import Future
+
+    from rdkit import Chem
+
+
+@contextmanager
+def timed(label: str) -> Iterator[None]:
+    """Log `label` with the elapsed wall-clock time of the wrapped block."""
+    t0 = time.perf_counter()
+    yield
+    logging.info("%s (%.2fs)", label, time.perf_counter() - t0)
+
+
+def _charge_method(value: str) -> ChargeMethod:
+    try:
+        return ChargeMethod.from_str(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+
 
 def main(argv: list[str] | None = None) -> None:
     p = argparse.ArgumentParser(
@@ -39,8 +65,14 @@ def main(argv: list[str] | None = None) -> None:
     )
     p.add_argument(
         "--ligand-charge-method",
-        default="BCC",
-        help="Ligand charge method for GAFF2 (e.g. BCC).",
+        type=_charge_method,
+        default=None,
+        help=(
+            "Ligand charge method for GAFF2: "
+            + ", ".join(m.value for m in ChargeMethod)
+            + " ('BCC' is accepted for am1bcc; 'gasteiger' is a fast, less accurate option for dry runs). "
+            + "Default: am1bcc, or gasteiger with --fast."
+        ),
     )
     p.add_argument(
         "--ligand-net-charge",
@@ -52,7 +84,13 @@ def main(argv: list[str] | None = None) -> None:
         "--work-dir",
         type=Path,
         default=None,
-        help="Working directory for parameterisation intermediates (optional).",
+        help="Working directory for parameterisation intermediates (optional; bypasses --param-cache).",
+    )
+    p.add_argument(
+        "--param-cache",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help="Directory of the on-disk parametrization cache.",
     )
     p.add_argument(
         "--water-mod",
@@ -75,34 +113,107 @@ def main(argv: list[str] | None = None) -> None:
     p.add_argument(
         "--min_steps",
         type=int,
-        default="10000",
-        help="Maximum number of steps for minimization procedure",
+        default=None,
+        help="Maximum number of steps for minimization procedure (default: 10000, or 500 with --fast)",
+    )
+    p.add_argument(
+        "--out-dir",
+        type=Path,
+        default=Path(),
+        help="Output directory; additional ligands of a multi-molecule SDF go to <out-dir>/ligand_<n>.",
+    )
+    p.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of ligands processed in parallel (GROMACS already uses all cores per run).",
+    )
+    p.add_argument(
+        "--dump-intermediates",
+        action="store_true",
+        help="Also write the solvated box and minimized structures (box.gro, minimized.gro).",
+    )
+    p.add_argument(
+        "--fast",
+        action="store_true",
+        help="Smoke-test preset: Gasteiger ligand charges and 500 minimization steps unless set explicitly.",
     )
     args = p.parse_args(argv)
 
+    # --fast only changes the defaults; explicitly given values always win.
+    if args.ligand_charge_method is None:
+        args.ligand_charge_method = ChargeMethod.GASTEIGER if args.fast else ChargeMethod.AM1BCC
+    if args.min_steps is None:
+        args.min_steps = 500 if args.fast else 10000
+
     # Basic sanity checks
     if not args.protein_pdb.exists():
         raise FileNotFoundError(args.protein_pdb)
     if not args.ligand_sdf.exists():
         raise FileNotFoundError(args.ligand_sdf)
 
-    # Preparing ligand - Reading, Standardizing, protonating and converting to sire
-    bss_ligand = ligand_converter(sdf_path=args.ligand_sdf)
-
-    # Calculating ligand parameter and adding protein forcefield
-    parametrized_complex = load_and_parameterise(
-        protein_pdb=args.protein_pdb,
-        ligand=bss_ligand,
-        protein_ff=args.protein_ff,
-        ligand_net_charge=args.ligand_net_charge,
-        ligand_charge_method=args.ligand_charge_method,
-        work_dir=args.work_dir,
-    )
-
-    # pickle.dump(parametrized_complex, "parametrized_complex.pickle")
-    # pickle.load("parametrized_complex.pickle")
-
-    logging.info("Parametrized the complex!")
+    ligands = _ligand_jobs(args)
+    if args.jobs == 1:
+        for ligand, out_dir, ligand_sdf in ligands:
+            _process_ligand(ligand, out_dir, ligand_sdf, args)
+        return
+
+    # Ligands are independent: run each complex in its own worker process. At most
+    # 2 * jobs ligands are submitted at a time so the SDF is still streamed.
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        pending: set[Future[None]] = set()
+        for ligand, out_dir, ligand_sdf in ligands:
+            if len(pending) >= 2 * args.jobs:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+            pending.add(executor.submit(_process_ligand, ligand, out_dir, ligand_sdf, args))
+        for future in as_completed(pending):
+            future.result()
+
+
+def _ligand_jobs(args: argparse.Namespace) -> Iterator[tuple[Chem.Mol, Path, Path]]:
+    """Yield (ligand, output directory, path of its prepared SDF copy) for each input ligand."""
+    for idx, ligand in enumerate(stream_ligands(args.ligand_sdf)):
+        out_dir = args.out_dir if idx == 0 else args.out_dir / f"ligand_{idx}"
+        yield ligand, out_dir, _ligand_copy_path(out_dir, idx, args.ligand_sdf)
+
+
+def _ligand_copy_path(out_dir: Path, idx: int, input_sdf: Path) -> Path:
+    """Return where the prepared copy of ligand `idx` is written.
+
+    The input SDF is still being streamed while ligands are written, so a
+    copy that resolves to the input file is refused instead of truncating it.
+    """
+    path = out_dir / f"ligand_{idx}_input.sdf"
+    if path.resolve() == input_sdf.resolve():
+        raise ValueError(f"Refusing to overwrite the input SDF {input_sdf}; choose a different --out-dir.")
+    return path
+
+
+def _process_ligand(ligand: Chem.Mol, out_dir: Path, ligand_sdf: Path, args: argparse.Namespace) -> None:
+    """Parametrize, solvate, minimize and heat one protein-ligand complex."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    ligand_sdf = write_ligand_sdf(ligand, ligand_sdf)
+
+    # Calculating ligand parameter and adding protein forcefield (cached on disk unless --work-dir is set)
+    with timed("Parametrized the complex!"):
+        inp = ParametrizationInput(
+            protein_pdb=args.protein_pdb,
+            ligand_sdf=ligand_sdf,
+            config=ParametrizationConfig(
+                protein_ff=ProteinFF.from_str(args.protein_ff),
+                charge_method=args.ligand_charge_method,
+            ),
+            net_charge=args.ligand_net_charge,
+            work_dir=args.work_dir / out_dir.relative_to(args.out_dir) if args.work_dir else None,
+        )
+        # An explicit --work-dir keeps the intermediates there instead of in the cache.
+        if inp.work_dir is not None:
+            parametrized_complex = parametrize(inp)
+        else:
+            parametrized_complex = load_or_parametrize(inp, cache_dir=args.param_cache)
 
     solvation_params = SolvationParams(
         water_model=WaterModel(args.water_mod.lower()),
@@ -110,29 +221,27 @@ def main(argv: list[str] | None = None) -> None:
         padding=args.padding,
     )
 
-    solvated_box = run_solvation(
-        system=parametrized_complex.system,
-        params=solvation_params,
-    )
-
-    logging.info("Solvation Done!")
-
-    BSS.IO.saveMolecules("box.pdb", solvated_box, fileformat="PDB")
-
-    minimized = run_minimization(nsteps=args.min_steps, system=solvated_box)
+    with timed("Solvation Done!"):
+        solvated_box = run_solvation(
+            system=BSS.IO.readMolecules([str(parametrized_complex.gro_file), str(parametrized_complex.top_file)]),
+            params=solvation_params,
+        )
 
-    logging.info("We are done with minimization!")
+    # Intermediates as GRO: far smaller and faster to write than PDB for solvated boxes.
+    if args.dump_intermediates:
+        BSS.IO.saveMolecules(str(out_dir / "box"), solvated_box, fileformat="Gro87")
 
-    BSS.IO.saveMolecules("minimized.pdb", minimized, fileformat="PDB")
+    with timed("We are done with minimization!"):
+        minimized = run_minimization(nsteps=args.min_steps, system=solvated_box)
 
-    t0 = time.time()
-    equilibrated_system = run_heating(500 * BSS.Units.Time.picosecond, minimized)
+    if args.dump_intermediates:
+        BSS.IO.saveMolecules(str(out_dir / "minimized"), minimized, fileformat="Gro87")
 
-    logging.info("After heating (%.1fs)", time.time() - t0)
-    t1 = time.time()
-    BSS.IO.saveMolecules("equilibrated.pdb", equilibrated_system, fileformat="PDB")
+    with timed("After heating"):
+        equilibrated_system = run_heating(500 * BSS.Units.Time.picosecond, minimized)
 
-    logging.info("Heating done(%.1fs)", time.time() - t1)
+    with timed("Saved equilibrated structure"):
+        BSS.IO.saveMolecules(str(out_dir / "equilibrated.pdb"), equilibrated_system, fileformat="PDB")
 
 
 if __name__ == "__main__":
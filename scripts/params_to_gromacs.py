@@ -13,9 +13,34 @@ Assumptions:
 from __future__ import annotations
 
 import argparse
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from gbsa_pipeline.parametrization import export_gromacs_top_gro, load_and_parameterise
+import BioSimSpace as BSS
+
+from gbsa_pipeline.cache import DEFAULT_CACHE_DIR, load_or_parametrize
+from gbsa_pipeline.ligand_preparation import stream_ligands, write_ligand_sdf
+from gbsa_pipeline.parametrization import (
+    ParametrizationConfig,
+    ParametrizationInput,
+    export_gromacs_top_gro,
+    parametrize,
+)
+from gbsa_pipeline.parametrization_enum import ChargeMethod, ProteinFF
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from rdkit import Chem
+
+
+def _charge_method(value: str) -> ChargeMethod:
+    try:
+        return ChargeMethod.from_str(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -28,7 +53,7 @@ def main(argv: list[str] | None = None) -> int:
         "-o",
         "--out-prefix",
         default="complex",
-        help="Output prefix (writes <prefix>.gro and <prefix>.top)",
+        help="Output prefix (writes <prefix>.gro and <prefix>.top; <prefix>_<n>.* for further ligands)",
     )
     p.add_argument(
         "--protein-ff",
@@ -38,8 +63,13 @@ def main(argv: list[str] | None = None) -> int:
     )
     p.add_argument(
         "--ligand-charge-method",
-        default="BCC",
-        help="Ligand charge method for GAFF2 (e.g. BCC).",
+        type=_charge_method,
+        default=ChargeMethod.AM1BCC,
+        help=(
+            "Ligand charge method for GAFF2: "
+            + ", ".join(m.value for m in ChargeMethod)
+            + " ('BCC' is accepted for am1bcc; 'gasteiger' is a fast, less accurate option for dry runs)."
+        ),
     )
     p.add_argument(
         "--ligand-net-charge",
@@ -51,7 +81,20 @@ def main(argv: list[str] | None = None) -> int:
         "--work-dir",
         type=Path,
         default=None,
-        help="Working directory for parameterisation intermediates (optional).",
+        help="Working directory for parameterisation intermediates (optional; bypasses --param-cache).",
+    )
+    p.add_argument(
+        "--param-cache",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help="Directory of the on-disk parametrization cache.",
+    )
+    p.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of ligands parametrized in parallel (default: number of CPUs).",
     )
 
     args = p.parse_args(argv)
@@ -62,20 +105,26 @@ def main(argv: list[str] | None = None) -> int:
     if not args.ligand_sdf.exists():
         raise FileNotFoundError(args.ligand_sdf)
 
-    complex_ = load_and_parameterise(
-        protein_pdb=args.protein_pdb,
-        ligand=args.ligand_sdf,
-        protein_ff=args.protein_ff,
-        ligand_net_charge=args.ligand_net_charge,
-        ligand_charge_method=args.ligand_charge_method,
-        work_dir=args.work_dir,
+    ligands = (
+        (ligand, args.out_prefix if idx == 0 else f"{args.out_prefix}_{idx}")
+        for idx, ligand in enumerate(stream_ligands(args.ligand_sdf, standardize=False))
     )
-
-    written = export_gromacs_top_gro(complex_.system, args.out_prefix)
-
-    print("Wrote:")
-    for f in written:
-        print(f"  - {f}")
+    if args.jobs == 1:
+        for ligand, out_prefix in ligands:
+            _report(_process_ligand(ligand, out_prefix, args))
+    else:
+        # Ligands are independent: parametrize them in parallel worker processes. At most
+        # 2 * jobs ligands are submitted at a time so the SDF is still streamed.
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            pending: set[Future[list[Path]]] = set()
+            for ligand, out_prefix in ligands:
+                if len(pending) >= 2 * args.jobs:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        _report(future.result())
+                pending.add(executor.submit(_process_ligand, ligand, out_prefix, args))
+            for future in as_completed(pending):
+                _report(future.result())
 
     print("\nNext steps (example):")
     print(f"  gmx grompp -f md.mdp -c {args.out_prefix}.gro -p {args.out_prefix}.top -o md.tpr")
@@ -84,5 +133,36 @@ def main(argv: list[str] | None = None) -> int:
     return 0
 
 
+def _report(files: list[Path]) -> None:
+    print("Wrote:")
+    for f in files:
+        print(f"  - {f}")
+
+
+def _process_ligand(ligand: Chem.Mol, out_prefix: str, args: argparse.Namespace) -> list[Path]:
+    """Parametrize one protein-ligand complex and export it as <out_prefix>.gro/.top."""
+    ligand_sdf = Path(f"{out_prefix}_ligand.sdf")
+    if ligand_sdf.resolve() == args.ligand_sdf.resolve():
+        # The input SDF is still being streamed; writing over it would lose the remaining ligands.
+        raise ValueError(f"Refusing to overwrite the input SDF {args.ligand_sdf}; choose a different --out-prefix.")
+    write_ligand_sdf(ligand, ligand_sdf)
+
+    inp = ParametrizationInput(
+        protein_pdb=args.protein_pdb,
+        ligand_sdf=ligand_sdf,
+        config=ParametrizationConfig(
+            protein_ff=ProteinFF.from_str(args.protein_ff),
+            charge_method=args.ligand_charge_method,
+        ),
+        net_charge=args.ligand_net_charge,
+        work_dir=args.work_dir / Path(out_prefix).name if args.work_dir else None,
+    )
+    # An explicit --work-dir keeps the intermediates there instead of in the cache.
+    complex_ = parametrize(inp) if inp.work_dir is not None else load_or_parametrize(inp, cache_dir=args.param_cache)
+    system = BSS.IO.readMolecules([str(complex_.gro_file), str(complex_.top_file)])
+
+    return export_gromacs_top_gro(system, out_prefix)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
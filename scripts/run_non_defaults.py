@@ -10,6 +10,7 @@ We perform equilibration with restraints by stepwise heating the system from 0 t
 
 from __future__ import annotations
 
+import hashlib
 import logging
 from pathlib import Path
 
@@ -27,12 +28,13 @@ def main() -> None:
     repo = Path(__file__).resolve().parents[1]  # scripts/ -> repo root
 
     # Input system
-    test_system = BSS.IO.readMolecules(
-        files=[
-            str(repo / "tests" / "testdata" / "test.gro"),
-            str(repo / "tests" / "testdata" / "test.top"),
+    test_system = _load_or_cache(
+        [
+            repo / "tests" / "testdata" / "test.gro",
+            repo / "tests" / "testdata" / "test.top",
         ],
         make_whole=True,
+        cache_dir=repo / ".cache" / "systems",
     )
 
     logger.info("Read System")
@@ -64,5 +66,28 @@ def main() -> None:
     logger.info("Saved: %s", out_path)
 
 
+def _load_or_cache(files: list[Path], *, make_whole: bool, cache_dir: Path) -> BSS._SireWrappers.System:
+    """Read a system once and reuse a streamed copy while the inputs are unchanged.
+
+    The cache key covers the file paths, their modification times and
+    `make_whole`, so editing an input invalidates the entry automatically.
+    """
+    digest = hashlib.sha256()
+    for f in sorted(files):
+        digest.update(f"{f.resolve()}\0{f.stat().st_mtime_ns}\0".encode())
+    digest.update(str(make_whole).encode())
+
+    cache_base = cache_dir / digest.hexdigest()
+    cache_file = cache_base.with_suffix(".s3")
+    if cache_file.exists():
+        logger.info("Loading cached system: %s", cache_file)
+        return BSS.Stream.load(str(cache_file))
+
+    system = BSS.IO.readMolecules(files=[str(f) for f in files], make_whole=make_whole)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    BSS.Stream.save(system, str(cache_base))  # writes <cache_base>.s3
+    return system
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,176 @@
+"""On-disk cache for parametrized protein-ligand complexes."""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from gbsa_pipeline.parametrization import (
+    _GAFF_FF_VERSION,
+    ParametrisedComplex,
+    ParametrizationConfig,
+    ParametrizationInput,
+    parametrize,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path("~/.cache/gbsa_pipeline/params").expanduser()
+
+_MANIFEST = "manifest.json"
+
+
+def parametrization_key(inp: ParametrizationInput) -> str:
+    """Return a SHA-256 key identifying the inputs of a parametrization run.
+
+    The key covers the protein and ligand file contents (coordinates end up in
+    the output files, so a SMILES-only key is not enough), any extra force
+    field files, the force field / charge method choices, the ligand net
+    charge and the GAFF version used by the template generator.
+    """
+    digest = hashlib.sha256()
+    for path in (inp.protein_pdb, inp.ligand_sdf, *inp.config.extra_ff_files):
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+
+    digest.update(inp.config.protein_ff.value.encode())
+    digest.update(b"\0")
+    digest.update(_GAFF_FF_VERSION[inp.config.ligand_ff].encode())
+    digest.update(b"\0")
+    digest.update(inp.config.charge_method.value.encode())
+    digest.update(b"\0")
+    digest.update(str(inp.net_charge).encode())
+    return digest.hexdigest()
+
+
+def _write_manifest(entry: Path, complex_: ParametrisedComplex) -> None:
+    manifest = {
+        "gro_file": complex_.gro_file.name,
+        "top_file": complex_.top_file.name,
+        "config": complex_.config.model_dump(mode="json"),
+    }
+    (entry / _MANIFEST).write_text(json.dumps(manifest), encoding="utf-8")
+
+
+def _read_manifest(entry: Path) -> ParametrisedComplex | None:
+    """Return the complex recorded in ``entry``, or ``None`` if it is missing or unusable."""
+    manifest_file = entry / _MANIFEST
+    if not manifest_file.exists():
+        return None
+    try:
+        manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+        cached = ParametrisedComplex(
+            gro_file=entry / manifest["gro_file"],
+            top_file=entry / manifest["top_file"],
+            config=ParametrizationConfig.model_validate(manifest["config"]),
+        )
+    except Exception:  # noqa: BLE001
+        logger.warning("Ignoring unreadable cache entry %s", entry)
+        return None
+    if not (cached.gro_file.exists() and cached.top_file.exists()):
+        return None
+    return cached
+
+
+def load_or_parametrize(inp: ParametrizationInput, cache_dir: Path = DEFAULT_CACHE_DIR) -> ParametrisedComplex:
+    """Return the parametrized complex for *inp*, reusing a cached result when available.
+
+    Each cache entry is a directory ``{cache_dir}/{key}`` holding the
+    ``complex.gro``/``complex.top`` files and a small ``manifest.json``
+    (file names plus force field configuration) written once
+    :func:`~gbsa_pipeline.parametrization.parametrize` has returned. A new
+    entry is built in a temporary sibling directory and renamed into place,
+    so concurrent runs on identical inputs never share a work directory;
+    the first rename wins and the others reuse it. ``inp.work_dir`` is
+    ignored.
+
+    Hits and misses return the same shape: only the file paths and the
+    configuration are set. ``forcefield`` and ``parmed_structure`` are always
+    ``None``, so callers that need them (e.g.
+    :func:`~gbsa_pipeline.solvation_openmm.solvate_openmm`) must call
+    :func:`~gbsa_pipeline.parametrization.parametrize` directly.
+
+    Parameters
+    ----------
+    inp:
+        Validated parametrization inputs.
+    cache_dir:
+        Root directory of the cache. Created if it does not exist.
+
+    Returns:
+    -------
+    ParametrisedComplex
+        The cached complex on a hit, otherwise a freshly parametrized one
+        read back from its new cache entry.
+    """
+    cache_dir = Path(cache_dir).expanduser()
+    entry = cache_dir / parametrization_key(inp)
+
+    cached = _read_manifest(entry)
+    if cached is not None:
+        logger.info("Loaded parametrized complex from cache: %s", entry)
+        return cached
+
+    logger.info("Parametrization cache miss; writing to %s", entry)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_entry = Path(tempfile.mkdtemp(prefix=f".{entry.name}.", dir=cache_dir))
+    try:
+        complex_ = parametrize(inp.model_copy(update={"work_dir": tmp_entry}))
+        _write_manifest(tmp_entry, complex_)
+        published = _publish(tmp_entry, entry)
+    finally:
+        shutil.rmtree(tmp_entry, ignore_errors=True)
+
+    if published is not None:  # another process published the same entry first
+        return published
+    return ParametrisedComplex(
+        gro_file=entry / complex_.gro_file.name,
+        top_file=entry / complex_.top_file.name,
+        config=complex_.config,
+    )
+
+
+def _publish(tmp_entry: Path, entry: Path) -> ParametrisedComplex | None:
+    """Rename ``tmp_entry`` to ``entry``; return the existing complex if another process won.
+
+    A published entry is never modified or deleted in place, since other
+    processes may be reading from it. An entry without a readable manifest
+    (e.g. left behind by an older version) is replaced under an exclusive
+    lock: it is re-checked, moved aside under a unique name and deleted from
+    there before the new entry is renamed in.
+    """
+    try:
+        os.rename(tmp_entry, entry)
+    except OSError:
+        pass
+    else:
+        return None
+
+    with open(entry.with_name(f".{entry.name}.lock"), "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        existing = _read_manifest(entry)
+        if existing is not None:
+            return existing
+
+        stale = Path(tempfile.mkdtemp(prefix=f".{entry.name}.stale.", dir=entry.parent))
+        try:
+            with contextlib.suppress(FileNotFoundError):
+                os.rename(entry, stale / entry.name)
+        finally:
+            shutil.rmtree(stale, ignore_errors=True)
+        try:
+            os.rename(tmp_entry, entry)
+        except OSError:
+            # A first-time publisher (no lock needed) got in after the stale entry moved.
+            existing = _read_manifest(entry)
+            if existing is None:
+                raise
+            return existing
+    return None
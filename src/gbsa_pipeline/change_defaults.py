@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 import BioSimSpace as BSS
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, model_validator
 
 from gbsa_pipeline.change_defaults_enum import (
     Barostat,
@@ -131,6 +131,20 @@ class GromacsParams(BaseModel):
     awh: bool = False
     rotation: bool = False
 
+    @model_validator(mode="before")
+    @classmethod
+    def _canonicalise_enums(cls, values: Any) -> Any:
+        """Map enum-typed values onto their canonical spelling (GROMACS is case-insensitive)."""
+        if not isinstance(values, Mapping):
+            return values
+
+        canonical = dict(values)
+        for key, value in values.items():
+            lookup = _ALLOWED_LC.get(key)
+            if lookup is not None and isinstance(value, str):
+                canonical[key] = lookup.get(value.strip().lower(), value)
+        return canonical
+
     @classmethod
     def from_mapping(cls, mapping: Mapping[str, Any]) -> GromacsParams:
         """Instantiate from a mapping using hyphenated keys."""
@@ -145,16 +159,15 @@ class GromacsParams(BaseModel):
         return cls(**kwargs)
 
     def to_mapping(self) -> dict[str, Any]:
-        """Return a GROMACS-style mapping (underscores -> hyphens)."""
-        result = {}
-
-        for field_name, field_value in self.model_dump().items():
-            serialized = field_value.value if isinstance(field_value, Enum) else field_value
+        """Return a GROMACS-style mapping (underscores -> hyphens).
 
-            key = field_name.replace("_", "-")
-            result[key] = serialized
-
-        return result
+        ``mode="json"`` lets pydantic-core unwrap enum members to their plain
+        string values, so no per-field ``isinstance`` check is needed here.
+        """
+        return {
+            field_name.replace("_", "-"): field_value
+            for field_name, field_value in self.model_dump(mode="json").items()
+        }
 
     def to_mdp_lines(self) -> list[str]:
         """Render parameters as mdp lines without any base file."""
@@ -168,6 +181,15 @@ class GromacsParams(BaseModel):
         return "\n".join(self.to_mdp_lines()) + "\n"
 
 
+# Allowed values of every enum-typed field, built once at import time.
+_ALLOWED: dict[str, frozenset[str]] = {
+    name: frozenset(member.value for member in field.annotation)
+    for name, field in GromacsParams.model_fields.items()
+    if isinstance(field.annotation, type) and issubclass(field.annotation, Enum)
+}
+_ALLOWED_LC: dict[str, dict[str, str]] = {key: {v.lower(): v for v in values} for key, values in _ALLOWED.items()}
+
+
 class GromacsCustom(BSS.Protocol.Custom):
     """Thin wrapper bridging `GromacsParams` to `BSS.Protocol.Custom`."""
 
@@ -176,17 +198,65 @@ class GromacsCustom(BSS.Protocol.Custom):
         params: GromacsParams | Mapping[str, Any] | None = None,
     ) -> None:
         """Create a custom protocol from params only (no base mdp)."""
-        self.params = (GromacsParams.from_mapping(params) if isinstance(params, Mapping) else params) or GromacsParams()
+        self._params = (
+            GromacsParams.from_mapping(params) if isinstance(params, Mapping) else params
+        ) or GromacsParams()
 
-        lines = self.params.to_mdp_lines()
+        lines = self._params.to_mdp_lines()
 
         with NamedTemporaryFile("w", suffix=".mdp", delete=False, encoding="utf-8") as tmp:
             tmp.write("\n".join(lines) + "\n")
             mdp_path = tmp.name
 
+        self._dirty = False
         super().__init__(mdp_path)
 
-        self._parameters = self.params.to_mapping()
+        self._parameters = self._params.to_mapping()
+
+    @property
+    def params(self) -> GromacsParams:
+        """Validated parameters, including any values staged with `set`."""
+        self._flush()
+        return self._params
+
+    def set(self, key: str, value: Any) -> None:
+        """Stage one mdp parameter (hyphenated or underscored key).
+
+        Unknown keys and invalid enum values are rejected immediately. The
+        full model is validated and rendered once, on the next `_flush`
+        (triggered by `getConfig` or reading `params`), so setting many keys
+        costs a single validation and config rebuild.
+        """
+        mdp_key = key.strip().replace("_", "-")
+        field_name = mdp_key.replace("-", "_")
+        if field_name not in GromacsParams.model_fields:
+            raise KeyError(f"Unknown parameter key: {key}")
+
+        lookup = _ALLOWED_LC.get(field_name)
+        if lookup is not None and isinstance(value, str):
+            canonical = lookup.get(value.strip().lower())
+            if canonical is None:
+                raise ValueError(
+                    f"Invalid value {value!r} for {mdp_key}; allowed: {', '.join(sorted(_ALLOWED[field_name]))}"
+                )
+            value = canonical
+
+        self._parameters[mdp_key] = value
+        self._dirty = True
+
+    def _flush(self) -> None:
+        """Validate staged parameters and regenerate the config lines."""
+        if not self._dirty:
+            return
+        self._params = GromacsParams.from_mapping(self._parameters)
+        self._parameters = self._params.to_mapping()
+        self._dirty = False
+        self.setConfig(self._params.to_mdp_lines())
+
+    def getConfig(self) -> list[str]:  # noqa: N802
+        """Return the config lines, applying any staged parameter changes first."""
+        self._flush()
+        return super().getConfig()
 
 
 # ============================================================================
@@ -206,15 +276,19 @@ def run_gro_custom(
         GromacsParams.from_mapping(parameters) if isinstance(parameters, Mapping) else parameters
     ) or GromacsParams()
 
-    merged = base_params.to_mapping()
+    if changes is None and params is None:
+        # Nothing to merge: skip the to_mapping/from_mapping re-validation round-trip.
+        final_params = base_params
+    else:
+        merged = base_params.to_mapping()
 
-    if changes is not None:
-        merged.update(changes)
+        if changes is not None:
+            merged.update(changes)
 
-    if params is not None:
-        merged.update(params if isinstance(params, Mapping) else params.to_mapping())
+        if params is not None:
+            merged.update(params if isinstance(params, Mapping) else params.to_mapping())
 
-    final_params = GromacsParams.from_mapping(merged)
+        final_params = GromacsParams.from_mapping(merged)
 
     custom_protocol = GromacsCustom(params=final_params)
 
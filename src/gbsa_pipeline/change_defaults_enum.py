@@ -1,4 +1,8 @@
-"""Classes for availible options in gms parameters."""
+"""Classes for available options in GROMACS mdp parameters.
+
+All option sets are `StrEnum`s, so every member is itself a `str` equal to its
+mdp value and is written out as-is by `format_gmx_value`.
+"""
 
 from enum import StrEnum
 
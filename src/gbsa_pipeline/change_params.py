@@ -2,50 +2,38 @@
 
 from __future__ import annotations
 
-from typing import Any
+import re
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
 
-def _leading_ws(s: str) -> str:
-    """Return the leading whitespace of `s`."""
-    i = 0
-    n = len(s)
-    while i < n and s[i].isspace():
-        i += 1
-    return s[:i]
 
+# One `key = value ; comment` line: (indent)(key)(sep)(value)(trailing ws)(comment).
+_MDP_LINE = re.compile(r"^(\s*)([^\s=;#]+)(\s*=\s*)([^;#\n]*?)(\s*)([;#].*)?$")
 
-def _split_inline_comment(s: str) -> tuple[str, str]:
-    """Split `s` into (before_comment, comment) for inline ';' or '#'.
 
-    Returns the earliest comment delimiter occurrence. If no delimiter exists,
-    returns (s, "").
-    """
-    semi = s.find(";")
-    hash_ = s.find("#")
-
-    if semi == -1 and hash_ == -1:
-        return s, ""
-    if semi == -1:
-        idx = hash_
-    elif hash_ == -1:
-        idx = semi
-    else:
-        idx = min(semi, hash_)
-
-    return s[:idx], s[idx:]
+# Exact-type fast path for the common value types; subclasses fall through to the ladder.
+_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    bool: lambda v: "yes" if v else "no",
+    int: str,
+    float: str,
+    str: str.strip,
+}
 
 
 def format_gmx_value(value: Any) -> str:
     """Convert Python values to GROMACS .mdp-compatible strings."""
-    if hasattr(value, "value"):  # Enum / StrEnum
-        value = value.value
+    fmt = _FORMATTERS.get(type(value))
+    if fmt is not None:
+        return fmt(value)
 
+    if isinstance(value, str):  # includes StrEnum members, which are their own value
+        return value.strip()
     if isinstance(value, bool):
         return "yes" if value else "no"
     if isinstance(value, (int, float)):
         return str(value)
-    if isinstance(value, str):
-        return value.strip()
 
     raise TypeError(f"Unsupported .mdp value type: {type(value).__name__}")
 
@@ -66,19 +54,70 @@ def set_mdp_key(lines: list[str], key: str, value: Any, *, inplace: bool = True)
     wanted = key.strip()
 
     for i, ln in enumerate(out):
-        if is_comment(ln):
+        if wanted not in ln:  # cheap substring prefilter; the regex rejects false positives
             continue
-
-        left, sep, right = ln.partition("=")
-        if not sep or left.strip() != wanted:
+        m = _MDP_LINE.match(ln)
+        if m is None or m[2] != wanted:
             continue
 
-        before_comment, comment = _split_inline_comment(right)
-        prefix = _leading_ws(before_comment)  # preserve whitespace before old value
-        out[i] = f"{left}={prefix}{mdp_value}{comment}"
+        if m[4] != mdp_value:  # leave lines that already hold the value untouched
+            out[i] = f"{m[1]}{m[2]}{m[3]}{mdp_value}{m[5]}{m[6] or ''}"
         break
     else:
         # key not found -> append in aligned format
         out.append(f"{wanted:<28} = {mdp_value}")
 
     return out
+
+
+def change_default_params(lines: list[str], params: Mapping[str, Any], *, inplace: bool = True) -> list[str]:
+    """Set several `key = value` pairs in .mdp-like lines in a single pass.
+
+    Thin wrapper around `change_default_params_bytes`: indentation, spacing
+    around '=' and inline comments are preserved; keys that are not present
+    are appended in the same aligned format as `set_mdp_key`. `lines` must not
+    carry line terminators. If `inplace` is False, returns a modified copy.
+    """
+    out = lines if inplace else list(lines)
+    if not params:
+        return out
+
+    buf = "".join(f"{ln}\n" for ln in out).encode("utf-8")
+    text = change_default_params_bytes(buf, params).decode("utf-8")
+    out[:] = text.split("\n")[:-1]
+    return out
+
+
+def change_default_params_bytes(buf: bytes | bytearray, params: Mapping[str, Any]) -> bytes:
+    """Set several `key = value` pairs in a whole UTF-8 .mdp buffer.
+
+    All keys are matched with one compiled alternation regex over the buffer,
+    so the file is edited as one contiguous block instead of a list of line
+    strings. Missing keys are appended as newline-terminated aligned lines.
+    The result can be written directly with `Path.write_bytes`.
+    """
+    values = {key.strip().encode("utf-8"): format_gmx_value(value).encode("utf-8") for key, value in params.items()}
+    if not values:
+        return bytes(buf)
+
+    pattern = re.compile(
+        rb"^(?P<lead>[ \t]*)(?P<key>"
+        + b"|".join(map(re.escape, values))
+        + rb")(?P<mid>[ \t]*=[ \t]*)(?P<val>[^;#\r\n]*?)(?P<trail>[ \t]*)(?P<cmt>[;#][^\r\n]*)?(?=\r?$)",
+        re.MULTILINE,
+    )
+    pending = dict(values)
+
+    def _repl(m: re.Match[bytes]) -> bytes:
+        # Only the first occurrence of a key is rewritten, like `set_mdp_key`.
+        new_value = pending.pop(m["key"], None)
+        if new_value is None or new_value == m["val"]:
+            return m[0]
+        return m["lead"] + m["key"] + m["mid"] + new_value + m["trail"] + (m["cmt"] or b"")
+
+    out = pattern.sub(_repl, buf)
+    if pending:
+        if out and not out.endswith(b"\n"):
+            out += b"\n"
+        out += b"".join(b"%-28s = %s\n" % item for item in pending.items())
+    return out
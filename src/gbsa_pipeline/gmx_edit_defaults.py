@@ -2,42 +2,86 @@
 
 from __future__ import annotations
 
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from gbsa_pipeline.change_params import change_default_params_bytes
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+_IO_BUF = 1 << 20
+
+# `key = value` pairs, skipping full-line comments and dropping inline comments.
+_KV = re.compile(r"^[ \t]*([^\s=#;]+)[ \t]*=[ \t]*([^#;\n]*)", re.MULTILINE)
+
+_BOOL = {"yes": True, "true": True, "on": True, "no": False, "false": False, "off": False}
+_INT_RE = re.compile(r"[+-]?\d+")
+_FLOAT_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
 
 
 def _parse_value(raw: str) -> Any:
     """Parse values from key=value text into bool/int/float/str."""
     text = raw.strip()
-    low = text.lower()
 
-    if low in {"yes", "true", "on"}:
-        return True
-    if low in {"no", "false", "off"}:
-        return False
+    flag = _BOOL.get(text.lower())
+    if flag is not None:
+        return flag
 
-    try:
-        if any(ch in text for ch in (".", "e", "E")):
-            return float(text)
+    if _INT_RE.fullmatch(text):
         return int(text)
-    except ValueError:
-        return text
+    if _FLOAT_RE.fullmatch(text):
+        return float(text)
+    return text
 
 
 def _read_changes_file(path: str | Path) -> dict[str, Any]:
     """Read non-default parameters from a key=value file."""
-    changes_path = Path(path)
-    changes: dict[str, Any] = {}
+    with open(os.fspath(path), "rb", buffering=_IO_BUF) as fh:
+        text = fh.read().decode("utf-8")
+    return {m[1]: _parse_value(m[2]) for m in _KV.finditer(text)}
+
+
+@lru_cache(maxsize=64)
+def _read_changes_cached(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a changes file once per (path, mtime, size); stat fields only key the cache."""
+    return _read_changes_file(path_str)
+
+
+def _load_changes(path: str | Path) -> dict[str, Any]:
+    """Return the parsed changes file, reusing the parse while the file is unchanged."""
+    st = os.stat(path)
+    return dict(_read_changes_cached(os.fspath(path), st.st_mtime_ns, st.st_size))
+
+
+def apply_changes(mdp_file: str | Path, changes_file: str | Path) -> Path:
+    """Apply the key=value overrides in `changes_file` to `mdp_file` in place.
+
+    The changes file is parsed once and reused for every mdp file patched
+    with it (e.g. minim/nvt/npt/md generated from one template) until it is
+    modified on disk.
+    """
+    return _apply_mapping(mdp_file, _load_changes(changes_file))
+
 
-    for line in changes_path.read_text(encoding="utf-8").splitlines():
-        s = line.strip()
-        if not s or s.startswith(("#", ";")):
-            continue
+def _apply_mapping(mdp_file: str | Path, changes: Mapping[str, Any]) -> Path:
+    mdp_path = Path(mdp_file)
+    original = mdp_path.read_bytes()
+    patched = change_default_params_bytes(original, changes)
+    if patched != original:  # keep the mtime of files that already match
+        mdp_path.write_bytes(patched)
+    return mdp_path
 
-        key, has_eq, raw_value = s.partition("=")
-        if not has_eq:
-            continue
 
-        changes[key.strip()] = _parse_value(raw_value)
+def apply_changes_many(mdp_files: Iterable[str | Path], changes_file: str | Path) -> list[Path]:
+    """Apply one changes file to several mdp files, parsing it only once.
 
-    return changes
+    Patching a file is microseconds of work, so this is a plain loop: a
+    process pool costs more to start (and, under spawn, to re-import the
+    package) than it could save.
+    """
+    changes = _load_changes(changes_file)
+    return [_apply_mapping(f, changes) for f in mdp_files]
@@ -1,9 +1,9 @@
 """Module to generate gromacs index files for a system."""
 
-from collections.abc import Sequence
-from io import TextIOWrapper
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 
+import numpy as np
 import sire
 import sire.system
 
@@ -18,35 +18,41 @@ def write_index_from_system(
     protein_idx = system.getIndex(protein)
     ligand_idx = system.getIndex(ligand)
 
-    receptor_atoms: list[int] = []
-    ligand_atoms: list[int] = []
+    # GROMACS uses 1-based indexing: molecule i spans atoms starts[i]..ends[i].
+    sizes = np.fromiter((mol.nAtoms() for mol in system), dtype=np.int64)
+    ends = np.cumsum(sizes)
+    starts = ends - sizes + 1
 
-    atom_counter = 1  # GROMACS uses 1-based indexing
+    receptor_atoms = _atom_range(starts, ends, protein_idx)
+    ligand_atoms = _atom_range(starts, ends, ligand_idx)
 
-    for i, mol in enumerate(system):
-        natoms = mol.nAtoms()
-        start = atom_counter
-        end = atom_counter + natoms
-        if i == protein_idx:
-            receptor_atoms.extend(range(start, end))
-        elif i == ligand_idx:
-            ligand_atoms.extend(range(start, end))
-        atom_counter = end
-
-    if not receptor_atoms:
+    if receptor_atoms.size == 0:
         raise RuntimeError("Protein atoms not found in system.")
 
-    if not ligand_atoms:
+    if ligand_atoms.size == 0:
         raise RuntimeError("Ligand atoms not found in system.")
 
-    with open(index_file, "w") as f:
-        f.write("[ Receptor ]\n")
-        _write_group(f, receptor_atoms)
+    # Stringify every atom number once, up front, rather than per output row.
+    labels = list(map(str, np.concatenate((receptor_atoms, ligand_atoms)).tolist()))
+    n_receptor = receptor_atoms.size
+
+    parts = ["[ Receptor ]\n"]
+    parts.extend(_group_lines(labels[:n_receptor]))
+    parts.append("\n[ Ligand ]\n")
+    parts.extend(_group_lines(labels[n_receptor:]))
+
+    # One write for the whole file instead of one per header/group.
+    Path(index_file).write_text("".join(parts), encoding="utf-8")
+
 
-        f.write("\n[ Ligand ]\n")
-        _write_group(f, ligand_atoms)
+def _atom_range(starts: np.ndarray, ends: np.ndarray, idx: int) -> np.ndarray:
+    """Return the 1-based atom numbers of molecule `idx` (empty if not in the system)."""
+    if not 0 <= idx < len(starts):
+        return np.empty(0, dtype=np.int64)
+    return np.arange(starts[idx], ends[idx] + 1)
 
 
-def _write_group(f: TextIOWrapper, atoms: Sequence[int], per_line: int = 15) -> None:
-    for i in range(0, len(atoms), per_line):
-        f.write(" ".join(map(str, atoms[i : i + per_line])) + "\n")
+def _group_lines(labels: Sequence[str], per_line: int = 15) -> Iterator[str]:
+    """Yield the newline-terminated rows of an index group, `per_line` atom labels per row."""
+    for i in range(0, len(labels), per_line):
+        yield " ".join(labels[i : i + per_line]) + "\n"
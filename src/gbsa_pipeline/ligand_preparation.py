@@ -1,5 +1,7 @@
 """Reading ligand from SDF file, standardizing with MolVS and adding hydrogens with RDKIT."""
 
+import logging
+from collections.abc import Iterator
 from os import PathLike
 from pathlib import Path
 
@@ -7,26 +9,54 @@ import sire as sr
 from molvs import Standardizer
 from rdkit import Chem
 
+logger = logging.getLogger(__name__)
+
 
 def load_ligand_sdf(sdf_path: PathLike | str) -> Chem.Mol:
     """Load the first molecule from an SDF file.
 
-    NOTE: RDKit reads a list of molecules from an SDF file.
-    Only the first molecule is processed.
+    NOTE: Only the first molecule is read; the rest of the file is not parsed.
     """
     path = Path(sdf_path)
     if not path.exists():
         raise FileNotFoundError(f"File not found: {sdf_path}")
 
-    molecule_list = Chem.SDMolSupplier(str(sdf_path), removeHs=False)
+    with open(path, "rb") as fh:
+        mol = next(Chem.ForwardSDMolSupplier(fh, removeHs=False), None)
 
-    if len(molecule_list) == 0 or molecule_list[0] is None:
+    if mol is None:
         raise ValueError(f"No valid molecules found in {sdf_path}")
 
-    mol = molecule_list[0]
     return mol
 
 
+def stream_ligands(sdf_path: PathLike | str, *, standardize: bool = True) -> Iterator[Chem.Mol]:
+    """Yield ligands from an SDF file one at a time.
+
+    Records are parsed lazily, so memory use does not grow with the number of
+    ligands in the file. Records RDKit cannot parse are skipped with a warning.
+    With `standardize` (default) each ligand goes through `ligand_standardizer`.
+    """
+    path = Path(sdf_path)
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {sdf_path}")
+
+    with open(path, "rb") as fh:
+        for idx, mol in enumerate(Chem.ForwardSDMolSupplier(fh, removeHs=False)):
+            if mol is None:
+                logger.warning("Skipping unreadable molecule #%d in %s", idx, sdf_path)
+                continue
+            yield ligand_standardizer(mol) if standardize else mol
+
+
+def write_ligand_sdf(mol: Chem.Mol, sdf_path: PathLike | str) -> Path:
+    """Write a single ligand (with 3D coordinates) to an SDF file."""
+    path = Path(sdf_path)
+    with Chem.SDWriter(str(path)) as writer:
+        writer.write(mol)
+    return path
+
+
 def ligand_standardizer(mol: Chem.Mol) -> Chem.Mol:
     """Standardize a ligand with MolVS and add hydrogen using RDKit."""
     s = Standardizer()
@@ -7,6 +7,7 @@ import logging
 import pickle
 import tempfile
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Union
@@ -45,6 +46,7 @@ class ParametrizationConfig(BaseModel):
     >>> ParametrizationConfig()  # all defaults
     >>> ParametrizationConfig(protein_ff=ProteinFF.FF19SB)  # swap protein FF
     >>> ParametrizationConfig.amber14_gaff2_nagl()  # preset with NAGL charges
+    >>> ParametrizationConfig.amber14_gaff2_gasteiger()  # fast preset for smoke tests
     """
 
     model_config = ConfigDict(frozen=True, extra="forbid", validate_default=True)
@@ -82,6 +84,11 @@ class ParametrizationConfig(BaseModel):
         """AMBER ff14SB + GAFF2 + NAGL graph-neural-network charges."""
         return cls(charge_method=ChargeMethod.NAGL)
 
+    @classmethod
+    def amber14_gaff2_gasteiger(cls) -> ParametrizationConfig:
+        """AMBER ff14SB + GAFF2 + Gasteiger charges (fast, for dry runs)."""
+        return cls(charge_method=ChargeMethod.GASTEIGER)
+
 
 # ---------------------------------------------------------------------------
 # User-facing input model
@@ -217,11 +224,6 @@ def _parametrize_openmm(inp: ParametrizationInput) -> ParametrisedComplex:
     work_dir = inp.work_dir or Path(tempfile.mkdtemp(prefix="gbsa_param_"))
     work_dir.mkdir(parents=True, exist_ok=True)
 
-    # --- Protein -------------------------------------------------------
-    logger.debug("Loading protein PDB: %s …", inp.protein_pdb)
-    pdb = PDBFile(str(inp.protein_pdb))
-    logger.debug("Protein PDB loaded (%d atoms).", pdb.topology.getNumAtoms())
-
     # --- Ligand --------------------------------------------------------
     logger.debug("Loading ligand SDF: %s …", inp.ligand_sdf)
     ligand = Molecule.from_file(str(inp.ligand_sdf))
@@ -244,19 +246,38 @@ def _parametrize_openmm(inp: ParametrizationInput) -> ParametrisedComplex:
     }
     if inp.net_charge is not None:
         kwargs["partial_charges"] = None  # reset; net_charge is passed separately
-    ligand.assign_partial_charges(**kwargs)
-    logger.debug("Partial charges assigned.")
 
-    # --- Force field ---------------------------------------------------
-    protein_xmls = _PROTEIN_FF_XML[inp.config.protein_ff]
-    extra_xmls = [str(p) for p in inp.config.extra_ff_files]
-    logger.debug(
-        "Building force field (protein=%s, extra=%d files) …",
-        inp.config.protein_ff.value,
-        len(extra_xmls),
-    )
-    forcefield = ForceField(*protein_xmls, *extra_xmls)
-    logger.debug("Force field built.")
+    # Charge assignment (sqm runs as a subprocess for AM1-BCC) is independent of
+    # the protein, so it runs in the background while the PDB and force field load.
+    # The AmberTools wrapper chdirs the whole process into a temp dir meanwhile,
+    # so every path read on this thread must be absolute.
+    protein_pdb = inp.protein_pdb.resolve()
+    extra_xmls = [str(p.resolve()) for p in inp.config.extra_ff_files]
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        charges = executor.submit(ligand.assign_partial_charges, **kwargs)
+
+        # --- Protein ---------------------------------------------------
+        logger.debug("Loading protein PDB: %s …", protein_pdb)
+        pdb = PDBFile(str(protein_pdb))
+        logger.debug("Protein PDB loaded (%d atoms).", pdb.topology.getNumAtoms())
+
+        # --- Force field -----------------------------------------------
+        protein_xmls = _PROTEIN_FF_XML[inp.config.protein_ff]
+        logger.debug(
+            "Building force field (protein=%s, extra=%d files) …",
+            inp.config.protein_ff.value,
+            len(extra_xmls),
+        )
+        forcefield = ForceField(*protein_xmls, *extra_xmls)
+        logger.debug("Force field built.")
+
+        charges.result()
+    finally:
+        # Do not hold back an error from the protein / force field loading until
+        # a minutes-long sqm run has finished; the worker thread is left to finish alone.
+        executor.shutdown(wait=False, cancel_futures=True)
+    logger.debug("Partial charges assigned.")
 
     logger.debug(
         "Registering GAFF template generator (%s) …",
@@ -15,12 +15,15 @@ class ProteinFF(StrEnum):
     @classmethod
     def from_str(cls, value: str) -> ProteinFF:
         """Case-insensitive lookup by value string."""
-        normalized = value.lower().strip()
-        for member in cls:
-            if member.value.lower() == normalized:
-                return member
-        supported = ", ".join(m.value for m in cls)
-        raise ValueError(f"Unsupported protein FF '{value}'. Supported: {supported}")
+        member = _PROTEIN_FF_LC.get(value.lower().strip())
+        if member is None:
+            supported = ", ".join(m.value for m in cls)
+            raise ValueError(f"Unsupported protein FF '{value}'. Supported: {supported}")
+        return member
+
+
+# Lowercased value -> member, built once instead of scanning the enum on every lookup.
+_PROTEIN_FF_LC: dict[str, ProteinFF] = {member.value.lower(): member for member in ProteinFF}
 
 
 class LigandFF(StrEnum):
@@ -37,8 +40,26 @@ class ChargeMethod(StrEnum):
     NAGL    -- Graph neural network trained to reproduce AM1-BCC charges.
                Requires ``openff-nagl`` and a model file.
     ESPALOMA -- End-to-end ML charges. Requires ``espaloma-charge``.
+    GASTEIGER -- Gasteiger-Marsili charges. Orders of magnitude faster than
+               AM1-BCC but less accurate; meant for dry runs and smoke tests.
     """
 
     AM1BCC = "am1bcc"
     NAGL = "nagl"
     ESPALOMA = "espaloma-am1bcc"
+    GASTEIGER = "gasteiger"
+
+    @classmethod
+    def from_str(cls, value: str) -> ChargeMethod:
+        """Case-insensitive lookup by value string; the legacy ``BCC`` spelling maps to AM1-BCC."""
+        member = _CHARGE_METHOD_LC.get(value.lower().strip())
+        if member is None:
+            supported = ", ".join(m.value for m in cls)
+            raise ValueError(f"Unsupported charge method '{value}'. Supported: {supported}")
+        return member
+
+
+_CHARGE_METHOD_LC: dict[str, ChargeMethod] = {
+    **{member.value.lower(): member for member in ChargeMethod},
+    "bcc": ChargeMethod.AM1BCC,
+}
@@ -0,0 +1,118 @@
+"""Tests for the on-disk parametrization cache."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from gbsa_pipeline import cache
+from gbsa_pipeline.parametrization import ParametrisedComplex, ParametrizationConfig, ParametrizationInput
+from gbsa_pipeline.parametrization_enum import ProteinFF
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def _make_input(tmp_path: Path, **kwargs: object) -> ParametrizationInput:
+    protein = tmp_path / "protein.pdb"
+    ligand = tmp_path / "ligand.sdf"
+    protein.write_text("ATOM\n")
+    ligand.write_text("LIG\n")
+    return ParametrizationInput(protein_pdb=protein, ligand_sdf=ligand, **kwargs)
+
+
+def _fake_parametrize(inp: ParametrizationInput) -> ParametrisedComplex:
+    assert inp.work_dir is not None
+    inp.work_dir.mkdir(parents=True, exist_ok=True)
+    gro = inp.work_dir / "complex.gro"
+    top = inp.work_dir / "complex.top"
+    gro.write_text("gro")
+    top.write_text("top")
+    # Stand-in for the unpicklable OpenMM force field of a real run.
+    return ParametrisedComplex(gro_file=gro, top_file=top, config=inp.config, forcefield=lambda: None)
+
+
+def _entries(cache_dir: Path) -> list[str]:
+    """Cache directory contents, ignoring the lock files used to replace stale entries."""
+    return sorted(p.name for p in cache_dir.iterdir() if p.suffix != ".lock")
+
+
+def test_key_depends_on_inputs(tmp_path: Path) -> None:
+    base = cache.parametrization_key(_make_input(tmp_path))
+
+    assert cache.parametrization_key(_make_input(tmp_path)) == base
+    assert cache.parametrization_key(_make_input(tmp_path, net_charge=1)) != base
+    ff19 = _make_input(tmp_path, config=ParametrizationConfig(protein_ff=ProteinFF.FF19SB))
+    assert cache.parametrization_key(ff19) != base
+
+
+def test_second_call_hits_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[ParametrizationInput] = []
+
+    def _counting(inp: ParametrizationInput) -> ParametrisedComplex:
+        calls.append(inp)
+        return _fake_parametrize(inp)
+
+    monkeypatch.setattr(cache, "parametrize", _counting)
+    inp = _make_input(tmp_path)
+
+    first = cache.load_or_parametrize(inp, cache_dir=tmp_path / "cache")
+    second = cache.load_or_parametrize(inp, cache_dir=tmp_path / "cache")
+
+    entry = tmp_path / "cache" / cache.parametrization_key(inp)
+    assert len(calls) == 1
+    assert second.gro_file == first.gro_file == entry / "complex.gro"
+    assert second.config == inp.config
+    assert calls[0].work_dir != entry
+    assert _entries(tmp_path / "cache") == [entry.name]
+    assert json.loads((entry / "manifest.json").read_text())["top_file"] == "complex.top"
+
+
+def test_concurrent_writer_entry_is_reused(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    inp = _make_input(tmp_path)
+    cache_dir = tmp_path / "cache"
+
+    def _racing(inp_: ParametrizationInput) -> ParametrisedComplex:
+        # Another worker publishes the same entry while this one is still running.
+        monkeypatch.setattr(cache, "parametrize", _fake_parametrize)
+        cache.load_or_parametrize(inp, cache_dir=cache_dir)
+        return _fake_parametrize(inp_)
+
+    monkeypatch.setattr(cache, "parametrize", _racing)
+
+    result = cache.load_or_parametrize(inp, cache_dir=cache_dir)
+
+    entry = cache_dir / cache.parametrization_key(inp)
+    assert result.gro_file == entry / "complex.gro"
+    assert _entries(cache_dir) == [entry.name]
+
+
+def test_hit_and_miss_return_the_same_shape(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cache, "parametrize", _fake_parametrize)
+    inp = _make_input(tmp_path)
+
+    miss = cache.load_or_parametrize(inp, cache_dir=tmp_path / "cache")
+    hit = cache.load_or_parametrize(inp, cache_dir=tmp_path / "cache")
+
+    assert (miss.gro_file, miss.top_file, miss.config) == (hit.gro_file, hit.top_file, hit.config)
+    assert miss.forcefield is None
+    assert hit.forcefield is None
+    assert miss.parmed_structure is None
+    assert hit.parmed_structure is None
+
+
+def test_stale_entry_is_replaced(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cache, "parametrize", _fake_parametrize)
+    inp = _make_input(tmp_path)
+    cache_dir = tmp_path / "cache"
+    entry = cache_dir / cache.parametrization_key(inp)
+    entry.mkdir(parents=True)
+    (entry / "complex.pickle").write_bytes(b"from an older version")
+
+    result = cache.load_or_parametrize(inp, cache_dir=cache_dir)
+
+    assert result.gro_file == entry / "complex.gro"
+    assert not (entry / "complex.pickle").exists()
+    assert _entries(cache_dir) == [entry.name]
@@ -0,0 +1,98 @@
+"""Unit tests for the .mdp line editing helpers in change_params."""
+
+from __future__ import annotations
+
+from gbsa_pipeline.change_params import (
+    change_default_params,
+    change_default_params_bytes,
+    format_gmx_value,
+    set_mdp_key,
+)
+
+_MDP = [
+    "; nsteps = 1",
+    "integrator = md",
+    "  nsteps   =  100   ; steps",
+    "nstxout-compressed = 5",
+    "nstxout = 3 # x",
+    "dt=0.001",
+]
+
+
+def test_change_default_params_rewrites_and_preserves_layout() -> None:
+    out = change_default_params(list(_MDP), {"nsteps": 20, "nstxout": 0, "dt": 0.002})
+
+    assert out[0] == "; nsteps = 1"
+    assert out[2] == "  nsteps   =  20   ; steps"
+    assert out[3] == "nstxout-compressed = 5"
+    assert out[4] == "nstxout = 0 # x"
+    assert out[5] == "dt=0.002"
+
+
+def test_change_default_params_appends_missing_keys() -> None:
+    out = change_default_params(list(_MDP), {"tcoupl": "v-rescale", "gen-vel": True})
+
+    assert out[: len(_MDP)] == _MDP
+    assert out[-2].split() == ["tcoupl", "=", "v-rescale"]
+    assert out[-1].split() == ["gen-vel", "=", "yes"]
+
+
+def test_change_default_params_not_inplace() -> None:
+    lines = list(_MDP)
+
+    out = change_default_params(lines, {"nsteps": 20}, inplace=False)
+
+    assert lines == _MDP
+    assert out is not lines
+
+
+def test_set_mdp_key_matches_change_default_params() -> None:
+    single = set_mdp_key(list(_MDP), "dt", 0.004)
+    batch = change_default_params(list(_MDP), {"dt": 0.004})
+
+    assert single == batch
+
+
+def test_set_mdp_key_preserves_comment_and_skips_commented_lines() -> None:
+    out = set_mdp_key(list(_MDP), "nsteps", 7, inplace=False)
+
+    assert out[0] == "; nsteps = 1"
+    assert out[2] == "  nsteps   =  7   ; steps"
+
+
+def test_change_default_params_bytes_keeps_line_endings() -> None:
+    out = change_default_params_bytes(b"a = 1\r\nb = 2 ; c\r\n", {"b": 3, "z": "q"})
+
+    assert out.startswith(b"a = 1\r\nb = 3 ; c\r\n")
+    assert out.endswith(b"z                            = q\n")
+
+
+def test_change_default_params_rewrites_first_occurrence_only() -> None:
+    out = change_default_params(["nsteps = 1", "nsteps = 2"], {"nsteps": 9})
+
+    assert out == ["nsteps = 9", "nsteps = 2"]
+    assert set_mdp_key(["nsteps = 1", "nsteps = 2"], "nsteps", 9) == out
+
+
+def test_set_mdp_key_keeps_line_object_when_value_matches() -> None:
+    lines = list(_MDP)
+    before = lines[2]
+
+    set_mdp_key(lines, "nsteps", 100)
+
+    assert lines[2] is before
+
+
+def test_format_gmx_value_keeps_signed_zero_independent_of_history() -> None:
+    assert format_gmx_value(-0.0) == "-0.0"
+    assert format_gmx_value(0.0) == "0.0"
+
+
+def test_trailing_whitespace_is_kept_and_not_part_of_the_value() -> None:
+    lines = ["nsteps = 20   ", "dt = 0.002\t"]
+
+    batch = change_default_params(list(lines), {"nsteps": 30, "dt": 0.002})
+
+    assert batch == ["nsteps = 30   ", "dt = 0.002\t"]
+    assert set_mdp_key(list(lines), "nsteps", 30) == batch[:1] + lines[1:]
+    assert change_default_params_bytes(b"nsteps = 20   \r\n", {"nsteps": 20}) == b"nsteps = 20   \r\n"
@@ -0,0 +1,65 @@
+"""Tests for the per-ligand file handling of scripts/first_run.py."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from rdkit import Chem
+from rdkit.Chem import AllChem
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "first_run.py"
+_PROTEIN = Path(__file__).resolve().parent / "testdata" / "test1.pdb"
+
+
+@pytest.fixture
+def first_run() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("first_run", _SCRIPT)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _write_ligands(path: Path, *smiles: str) -> None:
+    with Chem.SDWriter(str(path)) as writer:
+        for smi in smiles:
+            mol = Chem.AddHs(Chem.MolFromSmiles(smi))
+            AllChem.EmbedMolecule(mol, randomSeed=1)
+            writer.write(mol)
+
+
+def test_default_out_dir_keeps_input_sdf(
+    first_run: ModuleType, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    _write_ligands(tmp_path / "ligand.sdf", "CCO", "CCN")
+    original = (tmp_path / "ligand.sdf").read_bytes()
+
+    copies: list[Path] = []
+
+    def _fake_cache(inp: Any, cache_dir: Path) -> SimpleNamespace:
+        copies.append(inp.ligand_sdf)
+        return SimpleNamespace(gro_file=tmp_path / "complex.gro", top_file=tmp_path / "complex.top")
+
+    monkeypatch.setattr(first_run, "load_or_parametrize", _fake_cache)
+    for stage in ("BSS", "run_solvation", "run_minimization", "run_heating"):
+        monkeypatch.setattr(first_run, stage, MagicMock())
+
+    first_run.main([str(_PROTEIN), "ligand.sdf"])
+
+    assert (tmp_path / "ligand.sdf").read_bytes() == original
+    assert copies == [Path("ligand_0_input.sdf"), Path("ligand_1") / "ligand_1_input.sdf"]
+    assert all(Chem.MolFromMolFile(str(path)) is not None for path in copies)
+
+
+def test_ligand_copy_path_refuses_input_sdf(first_run: ModuleType, tmp_path: Path) -> None:
+    input_sdf = tmp_path / "ligand_0_input.sdf"
+
+    with pytest.raises(ValueError, match="Refusing to overwrite"):
+        first_run._ligand_copy_path(tmp_path, 0, input_sdf)
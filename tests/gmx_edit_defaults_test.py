@@ -0,0 +1,101 @@
+"""Unit tests for reading mdp changes files in gmx_edit_defaults."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from gbsa_pipeline.gmx_edit_defaults import (
+    _load_changes,
+    _parse_value,
+    _read_changes_file,
+    apply_changes,
+    apply_changes_many,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_read_changes_file_parses_types(tmp_path: Path) -> None:
+    changes = tmp_path / "changes.txt"
+    changes.write_text(
+        "; comment = 1\n# x = 2\n\nnsteps = 100 ; inline\ndt=0.002\ngen-vel = YES\ntcoupl = v-rescale\nnoeq\n",
+        encoding="utf-8",
+    )
+
+    assert _read_changes_file(changes) == {
+        "nsteps": 100,
+        "dt": 0.002,
+        "gen-vel": True,
+        "tcoupl": "v-rescale",
+    }
+
+
+def test_parse_value_classifies_numbers() -> None:
+    assert _parse_value("-5") == -5
+    assert _parse_value("+3") == 3
+    assert _parse_value("1e-3") == 0.001
+    assert _parse_value(".5") == 0.5
+    assert _parse_value("2.") == 2.0
+    assert _parse_value("1.0.0") == "1.0.0"
+    assert _parse_value("Protein") == "Protein"
+
+
+def test_read_changes_file_testdata() -> None:
+    changes = _read_changes_file("tests/testdata/custom_run_params/integrator.config")
+
+    assert changes["integrator"] == "md-vv"
+    assert changes["nsteps"] == 200
+    assert changes["mts"] is False
+
+
+def test_apply_changes_patches_mdp_in_place(tmp_path: Path) -> None:
+    changes = tmp_path / "changes.txt"
+    changes.write_text("nsteps = 20\ntcoupl = v-rescale\n", encoding="utf-8")
+    mdp = tmp_path / "md.mdp"
+    mdp.write_text("integrator = md\nnsteps = 100 ; steps\n", encoding="utf-8")
+
+    apply_changes(mdp, changes)
+
+    lines = mdp.read_text(encoding="utf-8").splitlines()
+    assert lines[:2] == ["integrator = md", "nsteps = 20 ; steps"]
+    assert lines[2].split() == ["tcoupl", "=", "v-rescale"]
+
+
+def test_changes_file_parse_is_reused_until_modified(tmp_path: Path) -> None:
+    changes = tmp_path / "changes.txt"
+    changes.write_text("nsteps = 20\n", encoding="utf-8")
+
+    first = _load_changes(changes)
+    first["nsteps"] = -1  # callers get a copy, not the cached dict
+    assert _load_changes(changes) == {"nsteps": 20}
+
+    changes.write_text("nsteps = 30\ndt = 0.002\n", encoding="utf-8")
+    assert _load_changes(changes) == {"nsteps": 30, "dt": 0.002}
+
+
+def test_apply_changes_many_patches_every_file(tmp_path: Path) -> None:
+    changes = tmp_path / "changes.txt"
+    changes.write_text("nsteps = 20\n", encoding="utf-8")
+    mdps = []
+    for stage in ("minim", "nvt", "npt", "md"):
+        mdp = tmp_path / f"{stage}.mdp"
+        mdp.write_text(f"; {stage}\nnsteps = 100\n", encoding="utf-8")
+        mdps.append(mdp)
+
+    assert apply_changes_many(mdps, changes) == mdps
+    for mdp in mdps:
+        assert mdp.read_text(encoding="utf-8").splitlines()[1] == "nsteps = 20"
+
+
+def test_apply_changes_skips_write_when_nothing_changes(tmp_path: Path) -> None:
+    changes = tmp_path / "changes.txt"
+    changes.write_text("nsteps = 20\nnstlog = 1\n", encoding="utf-8")
+    mdp = tmp_path / "md.mdp"
+    mdp.write_text("nsteps = 20 ; steps\nnstlog = 1   \n", encoding="utf-8")
+    os.utime(mdp, ns=(0, 0))
+
+    apply_changes(mdp, changes)
+
+    assert mdp.stat().st_mtime_ns == 0
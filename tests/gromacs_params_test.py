@@ -41,6 +41,7 @@ def test_params_defaults_are_applied_when_omitted() -> None:
     mapping = GromacsParams().to_mapping()
 
     assert mapping["integrator"] == "md"
+    assert type(mapping["integrator"]) is str
     assert mapping["comm-mode"] == "Linear"
     assert mapping["nsteps"] == 500
     assert mapping["dt"] == 0.001
@@ -72,6 +73,21 @@ def test_gromacs_custom_initialises_defaults() -> None:
     assert any("nsteps" in line and "500" in line for line in proto.getConfig())
 
 
+class _DummyProcess:
+    def __init__(self, system: object, protocol: object) -> None:
+        self._system = system
+        self.protocol = protocol
+
+    def start(self) -> None:
+        return None
+
+    def wait(self) -> None:
+        return None
+
+    def getSystem(self, *_args: Any, **_kwargs: Any) -> object:  # noqa: N802
+        return self._system
+
+
 def test_run_gro_custom_applies_overrides(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     class DummyProtocol:
         def __init__(self, config: str | None = None) -> None:
@@ -87,25 +103,11 @@ def test_run_gro_custom_applies_overrides(monkeypatch: pytest.MonkeyPatch, tmp_p
         def getConfig(self) -> list[str]:  # noqa: N802
             return list(self._config)
 
-    class DummyProcess:
-        def __init__(self, system: object, protocol: object) -> None:
-            self._system = system
-            self.protocol = protocol
-
-        def start(self) -> None:
-            return None
-
-        def wait(self) -> None:
-            return None
-
-        def getSystem(self, *_args: Any, **_kwargs: Any) -> object:  # noqa: N802
-            return self._system
-
     monkeypatch.setattr(
         "gbsa_pipeline.change_defaults.BSS.Protocol.Custom",
         DummyProtocol,
     )
-    monkeypatch.setattr("gbsa_pipeline.change_defaults.BSS.Process.Gromacs", DummyProcess)
+    monkeypatch.setattr("gbsa_pipeline.change_defaults.BSS.Process.Gromacs", _DummyProcess)
 
     system = object()
     customized, protocol = run_gro_custom(
@@ -124,3 +126,62 @@ def test_set_params_accepts_dataclass_and_kwargs() -> None:
 
     assert proto._parameters["nsteps"] == 25
     assert proto._parameters["comm-mode"] == "Linear"
+
+
+def test_params_enum_values_are_case_insensitive() -> None:
+    params = GromacsParams.from_mapping({"comm-mode": "angular", "integrator": " MD-VV ", "coulombtype": "pme"})
+
+    assert params.comm_mode is CommMode.ANGULAR
+    assert params.integrator is Integrator.VELOCITY_VERLET
+    assert params.to_mapping()["coulombtype"] == "PME"
+
+
+def test_gromacs_custom_set_updates_config() -> None:
+    proto = GromacsCustom(params=GromacsParams(nsteps=25))
+
+    proto.set("comm_mode", "Angular")
+    proto.set("nsteps", 50)
+
+    assert any("nsteps" in line and "50" in line for line in proto.getConfig())
+    assert proto.params.nsteps == 50
+    assert proto._parameters["comm-mode"] == "Angular"
+
+
+def test_gromacs_custom_set_rejects_invalid_enum_value() -> None:
+    proto = GromacsCustom()
+
+    with pytest.raises(ValueError, match="Angular"):
+        proto.set("comm-mode", "invalid")
+
+
+def test_gromacs_custom_set_validates_on_flush() -> None:
+    proto = GromacsCustom()
+
+    proto.set("nsteps", "many")
+
+    with pytest.raises(ValueError):
+        proto.getConfig()
+
+
+def test_gromacs_custom_params_reflect_staged_values() -> None:
+    proto = GromacsCustom()
+
+    proto.set("nsteps", 42)
+
+    assert proto.params.nsteps == 42
+
+
+def test_gromacs_custom_set_unknown_key_raises() -> None:
+    proto = GromacsCustom()
+
+    with pytest.raises(KeyError):
+        proto.set("not-a-key", 1)
+
+
+def test_run_gro_custom_without_overrides_reuses_params(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("gbsa_pipeline.change_defaults.BSS.Process.Gromacs", _DummyProcess)
+
+    params = GromacsParams(nsteps=7)
+    _, protocol = run_gro_custom(parameters=params, system=object())
+
+    assert cast("GromacsCustom", protocol).params is params
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import BioSimSpace as BSS
 import pytest
 
@@ -9,6 +11,8 @@ from gbsa_pipeline.ligand_preparation import (
     ligand_converter,
     ligand_standardizer,
     load_ligand_sdf,
+    stream_ligands,
+    write_ligand_sdf,
 )
 
 
@@ -37,3 +41,24 @@ def test_ligand_conversion() -> None:
     """Test conversion of the ligand."""
     mol = ligand_converter("tests/testdata/complex3.sdf")
     assert isinstance(mol, BSS._SireWrappers.Molecule)
+
+
+def test_stream_ligands_yields_standardized(tmp_path: Path) -> None:
+    """Streaming a two-record SDF yields both ligands, hydrogenated."""
+    single = Path("tests/testdata/complex3.sdf").read_text()
+    sdf = tmp_path / "two.sdf"
+    sdf.write_text(single + single)
+
+    ligands = list(stream_ligands(sdf))
+
+    assert len(ligands) == 2
+    assert all(mol.GetNumAtoms() == 72 for mol in ligands)
+
+
+def test_write_ligand_sdf_round_trip(tmp_path: Path) -> None:
+    """A written ligand can be read back with the same atom count."""
+    mol = ligand_standardizer(load_ligand_sdf("tests/testdata/complex3.sdf"))
+
+    out = write_ligand_sdf(mol, tmp_path / "ligand.sdf")
+
+    assert load_ligand_sdf(out).GetNumAtoms() == mol.GetNumAtoms()
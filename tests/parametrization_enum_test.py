@@ -0,0 +1,42 @@
+"""Tests for the parametrization enum lookups."""
+
+from __future__ import annotations
+
+import pytest
+
+from gbsa_pipeline.parametrization_enum import ChargeMethod, ProteinFF
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("am1bcc", ChargeMethod.AM1BCC),
+        ("BCC", ChargeMethod.AM1BCC),
+        (" Gasteiger ", ChargeMethod.GASTEIGER),
+        ("ESPALOMA-AM1BCC", ChargeMethod.ESPALOMA),
+    ],
+)
+def test_charge_method_from_str(value: str, expected: ChargeMethod) -> None:
+    assert ChargeMethod.from_str(value) is expected
+
+
+def test_charge_method_from_str_unknown_lists_supported() -> None:
+    with pytest.raises(ValueError, match="am1bcc, nagl, espaloma-am1bcc, gasteiger"):
+        ChargeMethod.from_str("resp")
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("ff14SB", ProteinFF.FF14SB),
+        ("FF19SB", ProteinFF.FF19SB),
+        ("  ff99sb\n", ProteinFF.FF99SB),
+    ],
+)
+def test_protein_ff_from_str_ignores_case_and_whitespace(value: str, expected: ProteinFF) -> None:
+    assert ProteinFF.from_str(value) is expected
+
+
+def test_protein_ff_from_str_unknown_lists_supported() -> None:
+    with pytest.raises(ValueError, match=r"Unsupported protein FF 'ff03'\. Supported: ff14SB, ff19SB, ff99SB"):
+        ProteinFF.from_str("ff03")
@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
+import os
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import MagicMock
 
 import BioSimSpace as BSS
 import pytest
+from openff.toolkit.topology import Molecule
+from openmm.app import PDBFile
 
 from gbsa_pipeline.parametrization import (
+    ParametrizationConfig,
+    ParametrizationInput,
     export_gromacs_top_gro,
     load_protein_pdb,
     parameterise_ligand_gaff2,
     parameterise_protein_amber,
+    parametrize,
 )
+from gbsa_pipeline.parametrization_enum import ChargeMethod, ProteinFF
 
 
 def test_read_1of1_molecules() -> None:
@@ -37,6 +48,104 @@ def test_read_empty() -> None:
         load_protein_pdb("tests/testdata/empty.pdb")
 
 
+def test_gasteiger_preset() -> None:
+    """The dry-run preset only swaps the charge method."""
+    config = ParametrizationConfig.amber14_gaff2_gasteiger()
+
+    assert config.charge_method is ChargeMethod.GASTEIGER
+    assert config.protein_ff is ProteinFF.FF14SB
+    assert config == ParametrizationConfig(charge_method=ChargeMethod.GASTEIGER)
+
+
+def test_gasteiger_charges_are_accepted_by_openff() -> None:
+    """The enum value is a partial charge method the OpenFF toolkit knows."""
+    ligand = Molecule.from_smiles("CCO")
+
+    ligand.assign_partial_charges(partial_charge_method=ChargeMethod.GASTEIGER.value)
+
+    assert ligand.partial_charges is not None
+    assert abs(sum(ligand.partial_charges.m)) < 1e-3
+
+
+def test_parametrize_protein_error_does_not_wait_for_charges(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A failing PDB load surfaces while the background charge job is still running."""
+    started, release, finished = threading.Event(), threading.Event(), threading.Event()
+
+    def _slow_charges(**_kwargs: Any) -> None:
+        started.set()
+        release.wait(timeout=30)
+        finished.set()
+
+    ligand = SimpleNamespace(conformers=[object()], n_atoms=1, assign_partial_charges=_slow_charges)
+
+    def _broken_pdb(_path: str) -> None:
+        started.wait(timeout=5)
+        raise ValueError("broken PDB")
+
+    monkeypatch.setattr("gbsa_pipeline.parametrization.Molecule", SimpleNamespace(from_file=lambda _path: ligand))
+    monkeypatch.setattr("gbsa_pipeline.parametrization.PDBFile", _broken_pdb)
+    sdf = tmp_path / "ligand.sdf"
+    sdf.write_text("")
+
+    try:
+        with pytest.raises(ValueError, match="broken PDB"):
+            parametrize(
+                ParametrizationInput(protein_pdb="tests/testdata/test1.pdb", ligand_sdf=sdf, work_dir=tmp_path / "w")
+            )
+        assert not finished.is_set()
+    finally:
+        release.set()
+
+
+def test_parametrize_loads_relative_paths_while_charges_chdir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The AmberTools charge job chdirs the whole process; relative inputs must still load."""
+    repo = Path(__file__).resolve().parents[1]
+    monkeypatch.chdir(repo)
+    sqm_dir = tmp_path / "sqm"
+    sqm_dir.mkdir()
+    extra_xml = tmp_path / "extra.xml"
+    extra_xml.write_text("<ForceField/>")
+    in_sqm_dir, loaded = threading.Event(), threading.Event()
+
+    def _chdir_charges(**_kwargs: Any) -> None:
+        os.chdir(sqm_dir)  # what openff's temporary_cd does around antechamber/sqm
+        try:
+            in_sqm_dir.set()
+            loaded.wait(timeout=5)
+        finally:
+            os.chdir(repo)
+        raise RuntimeError("stop after loading")
+
+    def _load_pdb(path: str) -> PDBFile:
+        in_sqm_dir.wait(timeout=5)
+        return PDBFile(path)
+
+    forcefield_args: list[str] = []
+
+    def _forcefield(*xmls: str) -> MagicMock:
+        forcefield_args.extend(xmls)
+        loaded.set()
+        return MagicMock()
+
+    ligand = SimpleNamespace(conformers=[object()], n_atoms=1, assign_partial_charges=_chdir_charges)
+    monkeypatch.setattr("gbsa_pipeline.parametrization.Molecule", SimpleNamespace(from_file=lambda _path: ligand))
+    monkeypatch.setattr("gbsa_pipeline.parametrization.PDBFile", _load_pdb)
+    monkeypatch.setattr("gbsa_pipeline.parametrization.ForceField", _forcefield)
+    sdf = tmp_path / "ligand.sdf"
+    sdf.write_text("")
+
+    with pytest.raises(RuntimeError, match="stop after loading"):
+        parametrize(
+            ParametrizationInput(
+                protein_pdb=Path("tests/testdata/test1.pdb"),
+                ligand_sdf=sdf,
+                config=ParametrizationConfig(extra_ff_files=(Path(os.path.relpath(extra_xml, repo)),)),
+                work_dir=tmp_path / "w",
+            )
+        )
+    assert forcefield_args[-1] == str(extra_xml.resolve())
+
+
 # ---------------------------------------------------------------------------
 # _FakeParamResult helper
 # ---------------------------------------------------------------------------